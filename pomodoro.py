@@ -3,13 +3,22 @@
 Pomodoro CLI Timer - A full-screen terminal countdown timer with ASCII banner display.
 """
 
-import argparse
+import math
 import os
+import re
+import select
+import signal
 import sys
 import time
 from datetime import date, timedelta
 from pathlib import Path
 
+try:
+    import termios
+    import tty
+except ImportError:  # Windows: no cbreak mode, keys are not read while counting down
+    termios = None
+
 # ASCII art digits (5 lines tall, variable width)
 DIGITS = {
     '0': [
@@ -91,122 +100,260 @@ DIGITS = {
     ],
 }
 
+# Each character's art as an immutable tuple of its rows, pre-encoded as
+# UTF-8 so frames never have to encode the block characters
+DIGIT_ROWS = {char: tuple(row.encode('utf-8') for row in rows) for char, rows in DIGITS.items()}
+
+# The same rows indexed by ord(char) - ord('0'); ':' follows '9' in ASCII
+DIGIT_LUT = tuple(DIGIT_ROWS[chr(ord('0') + i)] for i in range(11))
+
 DIGIT_HEIGHT = 5
 DIGIT_WIDTH = 5
 COLON_WIDTH = 5
 
+# Duration components such as "1h", "30m", "90s" or a bare "25"
+DURATION_RE = re.compile(r'(\d+)\s*([hms]?)')
+DURATION_UNITS = {'h': 3600, 'm': 60, 's': 1, '': 60}
 
-def get_terminal_size():
-    """Get the current terminal size."""
+# Zero-padded "00".."99", so format_time never runs the formatter
+TWO_DIGITS = tuple(f"{i:02d}" for i in range(100))
+
+# ANSI escape sequences, resolved once at import (no-ops when not a terminal)
+IS_TTY = sys.stdout.isatty()
+CLEAR = "\x1b[2J\x1b[H" if IS_TTY else ""
+CLEAR_BYTES = CLEAR.encode()
+ERASE_LINE = b"\x1b[2K"
+
+# Single keypresses ([p]ause, [q]uit) are read only from an interactive terminal
+KEY_INPUT = termios is not None and sys.stdin is not None and sys.stdin.isatty()
+
+# Set once stdin reaches EOF; no more keys can arrive after that
+_stdin_eof = False
+
+# Seconds between wake-ups while paused (there is no tick to wait for)
+PAUSED_POLL_INTERVAL = 1.0
+
+# Cached terminal size; without SIGWINCH (Windows) it is re-polled instead
+HAS_SIGWINCH = hasattr(signal, 'SIGWINCH')
+TERM_SIZE_POLL_INTERVAL = 2.0
+_term_size = None
+_term_size_checked = 0.0
+
+# What the last timer frame showed:
+# (time_str, pomodoro_count, paused, width, height); None forces a full repaint
+_last_frame = None
+
+# Output buffer reused by every timer frame
+_frame_buf = bytearray()
+
+
+def query_terminal_size():
+    """Ask the terminal for its current size."""
     try:
         columns, lines = os.get_terminal_size()
     except OSError:
+        columns, lines = 0, 0
+    # Some pseudo-terminals report 0x0 until they are sized
+    if columns <= 0 or lines <= 0:
         columns, lines = 80, 24
     return columns, lines
 
 
+def get_terminal_size():
+    """Get the terminal size, re-querying it only after a resize."""
+    global _term_size, _term_size_checked
+    if not HAS_SIGWINCH:
+        # No resize signal: re-poll the size every few seconds instead
+        now = time.monotonic()
+        if now - _term_size_checked >= TERM_SIZE_POLL_INTERVAL:
+            _term_size = None
+            _term_size_checked = now
+    if _term_size is None:
+        _term_size = query_terminal_size()
+    return _term_size
+
+
+def handle_resize(signum, frame):
+    """SIGWINCH handler: forget the cached size so the next frame re-queries it."""
+    global _term_size
+    _term_size = None
+
+
+def watch_terminal_size():
+    """Refresh the cached terminal size on SIGWINCH where the platform has it."""
+    if HAS_SIGWINCH:
+        signal.signal(signal.SIGWINCH, handle_resize)
+
+
+def reset_frame():
+    """Forget the last timer frame so the next one clears and repaints everything."""
+    global _last_frame
+    _last_frame = None
+
+
 def clear_screen():
     """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    reset_frame()
+    sys.stdout.write(CLEAR)
 
 
 def format_time(seconds):
     """Convert seconds to MM:SS format."""
-    minutes = seconds // 60
-    secs = seconds % 60
-    return f"{minutes:02d}:{secs:02d}"
+    minutes, secs = divmod(seconds, 60)
+    if minutes < 100:
+        return TWO_DIGITS[minutes] + ":" + TWO_DIGITS[secs]
+    return f"{minutes}:" + TWO_DIGITS[secs]
+
+
+def glyph_rows(char):
+    """Get the UTF-8 rows of a digit or ':' glyph (the '0' glyph for anything else)."""
+    index = ord(char) - ord('0')
+    if 0 <= index < len(DIGIT_LUT):
+        return DIGIT_LUT[index]
+    return DIGIT_LUT[0]
 
 
 def build_banner(time_str):
-    """Build the ASCII banner for the given time string."""
-    lines = [[] for _ in range(DIGIT_HEIGHT)]
+    """Build the UTF-8 banner rows for a format_time() string."""
+    columns = [glyph_rows(char) for char in time_str]
 
-    for char in time_str:
-        digit_art = DIGITS.get(char, DIGITS['0'])
-        for i, line in enumerate(digit_art):
-            lines[i].append(line)
+    # Transpose the per-character columns into rows, a space between digits
+    return tuple(b" ".join(row) for row in zip(*columns))
 
-    # Join each line with a space between digits
-    return [" ".join(line_parts) for line_parts in lines]
 
+def write_frame(frame):
+    """Write a complete frame to the terminal in a single write."""
+    # Push anything still sitting in the text layer (e.g. a pending clear)
+    sys.stdout.flush()
+    sys.stdout.buffer.write(frame)
+    sys.stdout.buffer.flush()
 
-def center_banner(banner_lines, term_width, term_height):
-    """Center the banner in the terminal."""
-    banner_width = len(banner_lines[0]) if banner_lines else 0
-    banner_height = len(banner_lines)
 
-    # Calculate padding
-    left_pad = max(0, (term_width - banner_width) // 2)
-    top_pad = max(0, (term_height - banner_height) // 2)
+def cursor_to(row, col):
+    """Escape sequence moving the cursor to a 0-based row and column."""
+    return f"\x1b[{row + 1};{col + 1}H".encode()
 
-    # Build centered output
-    output = []
 
-    # Top padding
-    for _ in range(top_pad):
-        output.append("")
+def render_frame(time_str, pomodoro_count, paused, term_width, term_height, out):
+    """
+    Append the bytes that bring the screen up to date with this frame to out.
 
-    # Banner lines with horizontal centering
-    for line in banner_lines:
-        output.append(" " * left_pad + line)
+    Only glyphs whose character differs from the last frame are redrawn, each
+    row behind a single cursor move. The first frame, a resize, or a change in
+    banner width repaints everything.
+    """
+    count_text = f"🍅 Pomodoros today: {pomodoro_count}"
+    if paused:
+        count_text += "  ·  PAUSED ([p] to resume)"
 
-    return "\n".join(output)
+    if not IS_TTY:
+        for row in build_banner(time_str):
+            out += row + b"\n"
+        out += count_text.encode('utf-8') + b"\n"
+        return
 
+    # Center the banner slightly above the middle, the count line below it
+    banner_width = len(time_str) * (DIGIT_WIDTH + 1) - 1
+    left_pad = max(0, (term_width - banner_width) // 2)
+    top_pad = max(0, (term_height - 2 - DIGIT_HEIGHT) // 2)
+    remaining_lines = term_height - (top_pad + DIGIT_HEIGHT) - DIGIT_HEIGHT - 2
+    count_row = top_pad + DIGIT_HEIGHT + (min(2, remaining_lines) if remaining_lines > 0 else 0)
+
+    prev = _last_frame
+    if (prev is None or prev[3:] != (term_width, term_height)
+            or len(prev[0]) != len(time_str)):
+        out += CLEAR_BYTES
+        prev_time_str = prev_status = None
+    else:
+        prev_time_str, prev_status = prev[0], prev[1:3]
 
-def display_timer(seconds_remaining, pomodoro_count):
-    """Display the timer banner."""
-    clear_screen()
+    for i, char in enumerate(time_str):
+        if prev_time_str is not None and prev_time_str[i] == char:
+            continue
+        col = left_pad + i * (DIGIT_WIDTH + 1)
+        if col + DIGIT_WIDTH > term_width:
+            break
+        glyph = glyph_rows(char)
+        for row in range(min(DIGIT_HEIGHT, term_height - top_pad)):
+            out += cursor_to(top_pad + row, col) + glyph[row]
 
-    term_width, term_height = get_terminal_size()
-    time_str = format_time(seconds_remaining)
-    banner_lines = build_banner(time_str)
+    if (pomodoro_count, paused) != prev_status and count_row < term_height:
+        # Erase the old line first: the paused marker changes its length
+        count_left_pad = max(0, (term_width - len(count_text)) // 2)
+        out += cursor_to(count_row, 0) + ERASE_LINE
+        out += cursor_to(count_row, count_left_pad) + count_text.encode('utf-8')
 
-    # Add pomodoro count below the timer
-    count_text = f"🍅 Pomodoros today: {pomodoro_count}"
+    # Park the cursor in the bottom-left corner, out of the way
+    out += cursor_to(term_height - 1, 0)
 
-    # Calculate banner width for centering the count text
-    banner_width = len(banner_lines[0]) if banner_lines else 0
-    left_pad = max(0, (term_width - banner_width) // 2)
-    count_left_pad = max(0, (term_width - len(count_text)) // 2)
 
-    # Adjust for count text
-    banner_lines.append("")  # Empty line
-    banner_lines.append(" " * (count_left_pad - left_pad) + count_text if count_left_pad > left_pad else count_text)
+def display_timer(seconds_remaining, pomodoro_count, paused=False):
+    """Display the timer banner."""
+    global _last_frame
+    term_width, term_height = get_terminal_size()
+    time_str = format_time(seconds_remaining)
+
+    # Nothing to draw if the screen already shows this exact frame
+    frame_key = (time_str, pomodoro_count, paused, term_width, term_height)
+    if frame_key == _last_frame:
+        return
 
-    centered_banner = center_banner(banner_lines[:-2], term_width, term_height - 2)
+    del _frame_buf[:]
+    render_frame(time_str, pomodoro_count, paused, term_width, term_height, _frame_buf)
+    _last_frame = frame_key
+    write_frame(_frame_buf)
 
-    # Print banner
-    print(centered_banner)
 
-    # Print the count at a fixed position
-    remaining_lines = term_height - centered_banner.count('\n') - DIGIT_HEIGHT - 3
-    if remaining_lines > 0:
-        print("\n" * min(2, remaining_lines), end="")
-    print(" " * count_left_pad + count_text)
+# Today's session file and count, cached until the date rolls over
+_session_date = None
+_session_file = None
+_cached_count = None
 
 
 def get_session_file():
     """Get the path to today's session file."""
-    data_dir = Path.home() / ".pomodoro"
-    data_dir.mkdir(exist_ok=True)
-    return data_dir / f"sessions_{date.today().isoformat()}.txt"
+    global _session_date, _session_file, _cached_count
+    today = date.today()
+    if today != _session_date:
+        data_dir = Path.home() / ".pomodoro"
+        data_dir.mkdir(exist_ok=True)
+        _session_file = data_dir / f"sessions_{today.isoformat()}.txt"
+        _session_date = today
+        _cached_count = None
+    return _session_file
 
 
 def load_pomodoro_count():
-    """Load today's pomodoro count from file."""
+    """Load today's pomodoro count, reading the file only once per day."""
+    global _cached_count
     session_file = get_session_file()
-    if session_file.exists():
+    if _cached_count is None:
         try:
-            return int(session_file.read_text().strip())
+            _cached_count = int(session_file.read_text().strip())
         except (ValueError, IOError):
-            return 0
-    return 0
+            _cached_count = 0
+    return _cached_count
 
 
 def save_pomodoro_count(count):
-    """Save today's pomodoro count to file."""
+    """Save today's pomodoro count to file, atomically replacing the old one."""
+    global _cached_count
     session_file = get_session_file()
-    session_file.write_text(str(count))
+
+    # Write a temporary file and rename it over the original, so a crash
+    # mid-write can never leave a truncated count behind. The name is per
+    # process so a concurrent save (e.g. --reset elsewhere) can't collide.
+    tmp_file = session_file.with_name(f"{session_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, 'w') as f:
+            f.write(str(count))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, session_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+    _cached_count = count
 
 
 def get_data_dir():
@@ -219,15 +366,21 @@ def load_all_sessions():
     data_dir = get_data_dir()
     sessions = {}
 
-    if not data_dir.exists():
+    try:
+        entries = list(os.scandir(data_dir))
+    except OSError:
+        # Missing, not a directory, or unreadable: no sessions recorded
         return sessions
 
-    for session_file in data_dir.glob("sessions_*.txt"):
+    for entry in entries:
+        name = entry.name
+        if not (name.startswith("sessions_") and name.endswith(".txt")):
+            continue
         try:
             # Extract date from filename: sessions_YYYY-MM-DD.txt
-            date_str = session_file.stem.replace("sessions_", "")
-            session_date = date.fromisoformat(date_str)
-            count = int(session_file.read_text().strip())
+            session_date = date.fromisoformat(name[len("sessions_"):-len(".txt")])
+            with open(entry.path, 'rb') as f:
+                count = int(f.read().strip())
             sessions[session_date] = count
         except (ValueError, IOError):
             continue
@@ -345,64 +498,144 @@ def display_stats(period="all"):
     print()
 
 
-def run_timer(duration_minutes):
-    """Run the pomodoro timer."""
+def enter_cbreak():
+    """Switch stdin to cbreak mode and return the settings to restore later."""
+    if not KEY_INPUT:
+        return None
+    fd = sys.stdin.fileno()
+    saved_attrs = termios.tcgetattr(fd)
+    tty.setcbreak(fd)
+    return saved_attrs
+
+
+def restore_input(saved_attrs):
+    """Restore the stdin settings saved by enter_cbreak()."""
+    if saved_attrs is not None:
+        termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, saved_attrs)
+
+
+def wait_for_key(timeout):
+    """Wait up to timeout seconds and return the key pressed, if any."""
+    global _stdin_eof
+    if not KEY_INPUT or _stdin_eof:
+        # No keys can arrive, just sleep out the timeout
+        time.sleep(timeout)
+        return None
+
+    ready, _, _ = select.select([sys.stdin], [], [], timeout)
+    if not ready:
+        return None
+    key = os.read(sys.stdin.fileno(), 1)
+    if not key:
+        # stdin hit EOF: stop selecting on it, it would always be readable
+        _stdin_eof = True
+        return None
+    return key.decode('utf-8', 'ignore').lower()
+
+
+def countdown(duration_seconds, pomodoro_count):
+    """Count down on screen. Returns False if the user quit early."""
+    # Count down against an absolute deadline so render time never drifts
+    deadline = time.monotonic() + duration_seconds
+    paused_remaining = None
+
+    while True:
+        if paused_remaining is None:
+            seconds_remaining = max(0, math.ceil(deadline - time.monotonic()))
+        display_timer(seconds_remaining, pomodoro_count, paused_remaining is not None)
+
+        if seconds_remaining == 0:
+            return True
+
+        # Sleep until the displayed second is due to change or a key arrives
+        if paused_remaining is None:
+            next_tick = deadline - (seconds_remaining - 1)
+            key = wait_for_key(max(0, next_tick - time.monotonic()))
+        else:
+            # Wake up now and then so a resize while paused still redraws
+            key = wait_for_key(PAUSED_POLL_INTERVAL)
+
+        if key == 'q':
+            return False
+        elif key == 'p':
+            if paused_remaining is None:
+                paused_remaining = deadline - time.monotonic()
+            else:
+                deadline = time.monotonic() + paused_remaining
+                paused_remaining = None
+
+
+def run_timer(duration_seconds):
+    """Run the pomodoro timer, restarting it for as long as the user asks."""
     pomodoro_count = load_pomodoro_count()
-    seconds_remaining = duration_minutes * 60
+    watch_terminal_size()
 
     try:
-        while seconds_remaining >= 0:
-            display_timer(seconds_remaining, pomodoro_count)
+        while True:
+            # The first frame of the run clears the screen itself
+            reset_frame()
+            saved_attrs = enter_cbreak()
+            try:
+                completed = countdown(duration_seconds, pomodoro_count)
+            finally:
+                restore_input(saved_attrs)
 
-            if seconds_remaining == 0:
+            if not completed:
+                clear_screen()
+                print(f"\n🍅 Session stopped. Pomodoros completed today: {pomodoro_count}\n")
                 break
 
-            time.sleep(1)
-            seconds_remaining -= 1
-
-        # Timer completed
-        pomodoro_count += 1
-        save_pomodoro_count(pomodoro_count)
-
-        # Show completion message
-        clear_screen()
-        term_width, term_height = get_terminal_size()
-
-        completion_msg = [
-            "⏰ TIME'S UP! ⏰",
-            "",
-            f"🍅 Pomodoros completed today: {pomodoro_count}",
-            "",
-            "What would you like to do?",
-            "",
-            "[r] Start another pomodoro",
-            "[q] Quit",
-        ]
-
-        # Center the completion message
-        top_pad = max(0, (term_height - len(completion_msg)) // 2)
-        print("\n" * top_pad)
-
-        for line in completion_msg:
-            left_pad = max(0, (term_width - len(line)) // 2)
-            print(" " * left_pad + line)
-
-        # Wait for user input
-        while True:
-            try:
-                choice = input("\n" + " " * ((term_width - 20) // 2) + "Your choice: ").strip().lower()
-                if choice == 'r':
-                    run_timer(duration_minutes)
+            # Timer completed; count it against the day it finished on
+            pomodoro_count = load_pomodoro_count() + 1
+            save_pomodoro_count(pomodoro_count)
+
+            # Show completion message
+            clear_screen()
+            term_width, term_height = get_terminal_size()
+
+            completion_msg = [
+                "⏰ TIME'S UP! ⏰",
+                "",
+                f"🍅 Pomodoros completed today: {pomodoro_count}",
+                "",
+                "What would you like to do?",
+                "",
+                "[r] Start another pomodoro",
+                "[q] Quit",
+            ]
+
+            # Center the completion message
+            top_pad = max(0, (term_height - len(completion_msg)) // 2)
+            print("\n" * top_pad)
+
+            for line in completion_msg:
+                left_pad = max(0, (term_width - len(line)) // 2)
+                print(f"{line:>{left_pad + len(line)}}")
+
+            # Wait for user input
+            restart = False
+            while True:
+                try:
+                    choice = input("\n" + " " * ((term_width - 20) // 2) + "Your choice: ").strip().lower()
+                    if choice == 'r':
+                        restart = True
+                        break
+                    elif choice == 'q':
+                        clear_screen()
+                        print(f"\n🍅 Great work! You completed {pomodoro_count} pomodoro(s) today.\n")
+                        break
+                    else:
+                        print(" " * ((term_width - 30) // 2) + "Please enter 'r' or 'q'")
+                except EOFError:
                     break
-                elif choice == 'q':
-                    clear_screen()
-                    print(f"\n🍅 Great work! You completed {pomodoro_count} pomodoro(s) today.\n")
-                    break
-                else:
-                    print(" " * ((term_width - 30) // 2) + "Please enter 'r' or 'q'")
-            except EOFError:
+
+            if not restart:
                 break
 
+            # Re-read before restarting so a restart past midnight starts from
+            # the new day's count (cheap: the count is cached)
+            pomodoro_count = load_pomodoro_count()
+
     except KeyboardInterrupt:
         clear_screen()
         print(f"\n🍅 Session interrupted. Pomodoros completed today: {pomodoro_count}\n")
@@ -410,37 +643,31 @@ def run_timer(duration_minutes):
 
 
 def parse_duration(duration_str):
-    """Parse duration string (e.g., '25', '25m', '1h30m', '90s')."""
-    duration_str = duration_str.strip().lower()
-
-    # Check for simple number (assume minutes)
-    if duration_str.isdigit():
-        return int(duration_str)
+    """Parse duration string (e.g., '25', '25m', '1h30m', '90s') into seconds."""
+    total_seconds = 0
 
-    total_minutes = 0
-    current_num = ""
+    # A bare number (or a trailing one without a suffix) means minutes
+    for match in DURATION_RE.finditer(duration_str.lower()):
+        total_seconds += int(match.group(1)) * DURATION_UNITS[match.group(2)]
 
-    for char in duration_str:
-        if char.isdigit():
-            current_num += char
-        elif char == 'h' and current_num:
-            total_minutes += int(current_num) * 60
-            current_num = ""
-        elif char == 'm' and current_num:
-            total_minutes += int(current_num)
-            current_num = ""
-        elif char == 's' and current_num:
-            total_minutes += int(current_num) / 60
-            current_num = ""
+    # Fall back to a one-minute timer when nothing usable was given
+    return total_seconds or 60
 
-    # Handle remaining number (assume minutes if no suffix)
-    if current_num:
-        total_minutes += int(current_num)
 
-    return max(1, int(total_minutes))
+def show_status():
+    """Print today's pomodoro count."""
+    count = load_pomodoro_count()
+    print(f"🍅 Pomodoros completed today: {count}")
 
 
 def main():
+    # Fast path: answer a bare --status without importing argparse
+    if sys.argv[1:] == ["--status"]:
+        show_status()
+        return
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="🍅 Pomodoro CLI Timer - A full-screen countdown timer",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -450,7 +677,7 @@ Examples:
   pomodoro 25m       Start a 25-minute timer
   pomodoro 1h        Start a 1-hour timer
   pomodoro 1h30m     Start a 1 hour 30 minute timer
-  pomodoro 90s       Start a 90-second timer (rounded to 2 minutes)
+  pomodoro 90s       Start a 90-second timer
 
 Statistics:
   pomodoro --stats              Show all-time statistics
@@ -496,8 +723,7 @@ Statistics:
         return
 
     if args.status:
-        count = load_pomodoro_count()
-        print(f"🍅 Pomodoros completed today: {count}")
+        show_status()
         return
 
     if args.stats is not None:
@@ -505,7 +731,10 @@ Statistics:
         return
 
     duration = parse_duration(args.duration)
-    print(f"🍅 Starting {duration}-minute pomodoro timer...")
+    if duration % 60 == 0:
+        print(f"🍅 Starting {duration // 60}-minute pomodoro timer...")
+    else:
+        print(f"🍅 Starting {format_time(duration)} pomodoro timer...")
     time.sleep(1)
 
     run_timer(duration)